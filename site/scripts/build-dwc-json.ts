@@ -7,9 +7,11 @@
  * Run: npx tsx scripts/build-dwc-json.ts
  */
 
-import { readFileSync, writeFileSync, mkdirSync } from "node:fs";
+import { writeFileSync, mkdirSync } from "node:fs";
+import { readFile } from "node:fs/promises";
 import { resolve, dirname } from "node:path";
 import { fileURLToPath } from "node:url";
+import type { DwcTerm } from "../src/data/dwcTerms";
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const SITE_ROOT = resolve(__dirname, "..");
@@ -31,23 +33,19 @@ interface DwcDpSchema {
   fields: DwcDpField[];
 }
 
-interface DwcTerm {
-  name: string;
-  label: string;
-  definition: string;
-  term_iri: string;
-  tables: string[];
-}
-
 /** Table schemas to include, in display order */
 const TABLES = ["event", "occurrence", "identification", "media"];
 
 const terms: Record<string, DwcTerm> = {};
 
-for (const table of TABLES) {
-  const path = resolve(SCHEMA_DIR, `${table}.json`);
-  const schema: DwcDpSchema = JSON.parse(readFileSync(path, "utf-8"));
+// Read all table schemas concurrently; merge below in TABLES order
+const schemas: DwcDpSchema[] = await Promise.all(
+  TABLES.map(async (table) =>
+    JSON.parse(await readFile(resolve(SCHEMA_DIR, `${table}.json`), "utf-8"))
+  )
+);
 
+for (const schema of schemas) {
   for (const field of schema.fields) {
     const name = field.name;
     const existing = terms[name];
@@ -1,13 +1,14 @@
 import { Box } from "@mui/material";
+import type { SxProps, Theme } from "@mui/material";
 import type { DwcTerm } from "../data/dwcTerms";
-import type { LexiconProperty } from "../data/lexicons";
-import { FIELD_TO_DWC, ATPROTO_FIELDS } from "../data/lexicons";
 import { palette, fonts } from "../theme";
 
 interface Props {
-  classes: string[];
-  dwcTerms: Record<string, DwcTerm>;
-  lexProps: Record<string, LexiconProperty & { required?: boolean }>;
+  classes: readonly string[];
+  /** Terms grouped by DwC-DP table, each group sorted by name */
+  dwcTermsByTable: Record<string, DwcTerm[]>;
+  /** Names of DwC terms some lexicon field maps to */
+  mappedTerms: ReadonlySet<string>;
 }
 
 interface Row {
@@ -17,27 +18,62 @@ interface Row {
   iri?: string;
 }
 
-export default function DwcAlignmentTable({ classes, dwcTerms, lexProps }: Props) {
-  const lexByDwc = new Map<string, string>();
-  for (const fieldName of Object.keys(lexProps)) {
-    if (ATPROTO_FIELDS.has(fieldName)) continue;
-    const dwcName = FIELD_TO_DWC[fieldName] ?? fieldName;
-    if (dwcName in dwcTerms) lexByDwc.set(dwcName, fieldName);
-  }
+const rowSx: SxProps<Theme> = {
+  borderBottom: `1px solid ${palette.ruleSoft}`,
+  display: "flex",
+  alignItems: "baseline",
+  gap: { xs: "8px", sm: "10px" },
+  py: "6px",
+};
+
+const termBase = {
+  fontFamily: fonts.mono,
+  fontSize: "12px",
+  flex: 1,
+  minWidth: 0,
+  overflowWrap: "anywhere",
+} satisfies SxProps<Theme>;
+
+const termSx: SxProps<Theme> = { ...termBase, color: palette.ink };
+
+const unmappedTermSx: SxProps<Theme> = { ...termBase, color: palette.warn };
+
+const termLinkSx: SxProps<Theme> = { color: "inherit", textDecoration: "none" };
 
+const clsSx: SxProps<Theme> = {
+  fontFamily: fonts.mono,
+  fontSize: "11px",
+  color: palette.inkFaint,
+  display: { xs: "none", sm: "block" },
+  flex: "0 0 auto",
+};
+
+const statusBase = {
+  fontFamily: fonts.mono,
+  fontSize: "11px",
+  textAlign: "right",
+  flex: "0 0 auto",
+} satisfies SxProps<Theme>;
+
+const statusSx: SxProps<Theme> = { ...statusBase, color: palette.moss };
+
+const unmappedStatusSx: SxProps<Theme> = { ...statusBase, color: palette.warn };
+
+export default function DwcAlignmentTable({
+  classes,
+  dwcTermsByTable,
+  mappedTerms,
+}: Props) {
   const rows: Row[] = [];
   const seen = new Set<string>();
   for (const cls of classes) {
-    const clsTerms = Object.values(dwcTerms)
-      .filter((t) => t.tables.includes(cls))
-      .sort((a, b) => a.name.localeCompare(b.name));
-    for (const t of clsTerms) {
+    for (const t of dwcTermsByTable[cls] ?? []) {
       if (seen.has(t.name)) continue;
       seen.add(t.name);
       rows.push({
         term: t.name,
         cls,
-        mapped: lexByDwc.has(t.name),
+        mapped: mappedTerms.has(t.name),
         iri: t.term_iri,
       });
     }
@@ -46,33 +82,15 @@ export default function DwcAlignmentTable({ classes, dwcTerms, lexProps }: Props
   return (
     <Box sx={{ fontSize: "12.5px", borderTop: `1px solid ${palette.rule}` }}>
       {rows.map((r) => (
-        <Box
-          key={r.term}
-          sx={{
-            borderBottom: `1px solid ${palette.ruleSoft}`,
-            display: "flex",
-            alignItems: "baseline",
-            gap: { xs: "8px", sm: "10px" },
-            py: "6px",
-          }}
-        >
-          <Box
-            sx={{
-              fontFamily: fonts.mono,
-              fontSize: "12px",
-              color: r.mapped ? palette.ink : palette.warn,
-              flex: 1,
-              minWidth: 0,
-              overflowWrap: "anywhere",
-            }}
-          >
+        <Box key={r.term} sx={rowSx}>
+          <Box sx={r.mapped ? termSx : unmappedTermSx}>
             {r.iri ? (
               <Box
                 component="a"
                 href={r.iri}
                 target="_blank"
                 rel="noopener"
-                sx={{ color: "inherit", textDecoration: "none" }}
+                sx={termLinkSx}
               >
                 {r.term}
               </Box>
@@ -80,26 +98,8 @@ export default function DwcAlignmentTable({ classes, dwcTerms, lexProps }: Props
               r.term
             )}
           </Box>
-          <Box
-            sx={{
-              fontFamily: fonts.mono,
-              fontSize: "11px",
-              color: palette.inkFaint,
-              display: { xs: "none", sm: "block" },
-              flex: "0 0 auto",
-            }}
-          >
-            {r.cls}
-          </Box>
-          <Box
-            sx={{
-              fontFamily: fonts.mono,
-              fontSize: "11px",
-              color: r.mapped ? palette.moss : palette.warn,
-              textAlign: "right",
-              flex: "0 0 auto",
-            }}
-          >
+          <Box sx={clsSx}>{r.cls}</Box>
+          <Box sx={r.mapped ? statusSx : unmappedStatusSx}>
             {r.mapped ? "mapped" : "—"}
           </Box>
         </Box>
@@ -1,17 +1,48 @@
 import { Box } from "@mui/material";
-import type { LexiconProperty } from "../data/lexicons";
-import { typeLabel, FIELD_TO_DWC, ATPROTO_FIELDS } from "../data/lexicons";
+import type { SxProps, Theme } from "@mui/material";
+import type { FlatField } from "../data/lexicons";
 import type { DwcTerm } from "../data/dwcTerms";
 import { palette, fonts } from "../theme";
 
-type FlatField = LexiconProperty & { required: boolean; def: string };
-
 interface Props {
   fields: Record<string, FlatField>;
-  dwcTerms: Record<string, DwcTerm>;
+  /** Lexicon field -> DwC term, from getFieldDwcTerms */
+  fieldTerms: Map<string, DwcTerm>;
 }
 
-export default function FieldTable({ fields, dwcTerms }: Props) {
+const rowSx: SxProps<Theme> = {
+  borderBottom: `1px solid ${palette.ruleSoft}`,
+  display: "flex",
+  flexDirection: { xs: "column", sm: "row" },
+  alignItems: { sm: "flex-start" },
+  gap: { xs: "2px", sm: "12px" },
+  py: "10px",
+};
+
+const nameSx: SxProps<Theme> = {
+  fontFamily: fonts.mono,
+  fontSize: "12.5px",
+  color: palette.forest,
+  flex: { sm: "0 0 200px" },
+  overflowWrap: "anywhere",
+};
+
+const requiredSx: SxProps<Theme> = { color: palette.warn, ml: "4px" };
+
+const bodySx: SxProps<Theme> = { color: palette.inkSoft, flex: 1, minWidth: 0 };
+
+/** Mono sub-line under the description (type/DwC link, known values) */
+const metaSx: SxProps<Theme> = {
+  fontFamily: fonts.mono,
+  fontSize: "10.5px",
+  color: palette.inkFaint,
+  mt: "3px",
+  wordBreak: "break-word",
+};
+
+const dwcLinkSx: SxProps<Theme> = { color: palette.inkFaint, textDecoration: "none" };
+
+export default function FieldTable({ fields, fieldTerms }: Props) {
   const entries = Object.entries(fields);
   return (
     <Box
@@ -22,46 +53,19 @@ export default function FieldTable({ fields, dwcTerms }: Props) {
       }}
     >
       {entries.map(([name, prop]) => {
-        const dwcName = FIELD_TO_DWC[name] ?? name;
-        const dwcTerm = !ATPROTO_FIELDS.has(name) ? dwcTerms[dwcName] : undefined;
+        const dwcTerm = fieldTerms.get(name);
         return (
-          <Box
-            key={name}
-            sx={{
-              borderBottom: `1px solid ${palette.ruleSoft}`,
-              display: "flex",
-              flexDirection: { xs: "column", sm: "row" },
-              alignItems: { sm: "flex-start" },
-              gap: { xs: "2px", sm: "12px" },
-              py: "10px",
-            }}
-          >
-            <Box
-              sx={{
-                fontFamily: fonts.mono,
-                fontSize: "12.5px",
-                color: palette.forest,
-                flex: { sm: "0 0 200px" },
-                overflowWrap: "anywhere",
-              }}
-            >
+          <Box key={name} sx={rowSx}>
+            <Box sx={nameSx}>
               {name}
               {prop.required && (
-                <Box component="span" sx={{ color: palette.warn, ml: "4px" }}>*</Box>
+                <Box component="span" sx={requiredSx}>*</Box>
               )}
             </Box>
-            <Box sx={{ color: palette.inkSoft, flex: 1, minWidth: 0 }}>
+            <Box sx={bodySx}>
               {prop.description ?? ""}
-              <Box
-                sx={{
-                  fontFamily: fonts.mono,
-                  fontSize: "10.5px",
-                  color: palette.inkFaint,
-                  mt: "3px",
-                  wordBreak: "break-word",
-                }}
-              >
-                {typeLabel(prop)}
+              <Box sx={metaSx}>
+                {prop.typeLabel}
                 {dwcTerm && (
                   <>
                     {" · "}
@@ -70,25 +74,17 @@ export default function FieldTable({ fields, dwcTerms }: Props) {
                       href={dwcTerm.term_iri}
                       target="_blank"
                       rel="noopener"
-                      sx={{ color: palette.inkFaint, textDecoration: "none" }}
+                      sx={dwcLinkSx}
                     >
                       dwc:{dwcTerm.name}
                     </Box>
                   </>
                 )}
               </Box>
-              {prop.knownValues && (
-                <Box
-                  sx={{
-                    fontFamily: fonts.mono,
-                    fontSize: "10.5px",
-                    color: palette.inkFaint,
-                    mt: "3px",
-                    wordBreak: "break-word",
-                  }}
-                >
+              {prop.knownValuesLabel && (
+                <Box sx={metaSx}>
                   <strong>{"Known values: "}</strong>
-                  {prop.knownValues.join(", ")}
+                  {prop.knownValuesLabel}
                 </Box>
               )}
             </Box>
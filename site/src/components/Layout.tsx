@@ -22,6 +22,13 @@ const navLinkStyle: React.CSSProperties = {
   color: palette.inkSoft,
   textDecoration: "none",
   alignSelf: "baseline",
+  fontWeight: 400,
+};
+
+const navLinkActiveStyle: React.CSSProperties = {
+  ...navLinkStyle,
+  color: palette.ink,
+  fontWeight: 500,
 };
 
 export default function Layout() {
@@ -95,11 +102,7 @@ export default function Layout() {
             key={to}
             to={to}
             end={end}
-            style={({ isActive }) => ({
-              ...navLinkStyle,
-              color: isActive ? palette.ink : palette.inkSoft,
-              fontWeight: isActive ? 500 : 400,
-            })}
+            style={({ isActive }) => (isActive ? navLinkActiveStyle : navLinkStyle)}
           >
             {label}
           </NavLink>
@@ -10,3 +10,14 @@ export interface DwcTerm {
 }
 
 export const dwcTerms = dwcData as Record<string, DwcTerm>;
+
+/** DwC-DP table -> terms in that table, sorted by name (built once at load) */
+export const dwcTermsByTable: Record<string, DwcTerm[]> = {};
+for (const term of Object.values(dwcTerms)) {
+  for (const table of term.tables) {
+    (dwcTermsByTable[table] ??= []).push(term);
+  }
+}
+for (const terms of Object.values(dwcTermsByTable)) {
+  terms.sort((a, b) => a.name.localeCompare(b.name));
+}
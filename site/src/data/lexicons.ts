@@ -1,6 +1,7 @@
 import occurrenceJson from "../../../lexicons/bio/lexicons/temp/v0-1/occurrence.json";
 import identificationJson from "../../../lexicons/bio/lexicons/temp/v0-1/identification.json";
 import mediaJson from "../../../lexicons/bio/lexicons/temp/v0-1/media.json";
+import type { DwcTerm } from "./dwcTerms";
 
 export interface LexiconDef {
   type: string;
@@ -45,7 +46,7 @@ export interface ModelConfig {
   name: string;
   slug: string;
   lexicon: Lexicon;
-  classes: string[];
+  classes: readonly string[];
   description: string;
   shortExample: string;
   fullExample: string;
@@ -170,10 +171,10 @@ export const MODELS: ModelConfig[] = [
 ];
 
 /** Lexicon field -> DwC term_localName (when names differ) */
-export const FIELD_TO_DWC: Record<string, string> = {};
+export const FIELD_TO_DWC: Readonly<Record<string, string>> = {};
 
 /** Fields that are AT Protocol infrastructure (no DwC mapping) */
-export const ATPROTO_FIELDS = new Set([
+export const ATPROTO_FIELDS: ReadonlySet<string> = new Set([
   "occurrence",
   "image",
   "alt",
@@ -184,53 +185,99 @@ export const ATPROTO_FIELDS = new Set([
 ]);
 
 /** GBIF publishing requirements */
-export const GBIF_REQUIRED = new Set([
+export const GBIF_REQUIRED: ReadonlySet<string> = new Set([
   "occurrenceID",
   "scientificName",
   "eventDate",
 ]);
 
-export const GBIF_RECOMMENDED = new Set([
+export const GBIF_RECOMMENDED: ReadonlySet<string> = new Set([
   "taxonRank",
   "kingdom",
   "decimalLatitude",
   "decimalLongitude",
 ]);
 
+/** Shared required set for defs that declare no required fields */
+const NO_REQUIRED: ReadonlySet<string> = new Set();
+
 /** Get properties and required set from a def body */
 export function getDefProperties(
   def: LexiconDef
-): { properties: Record<string, LexiconProperty>; required: Set<string> } {
-  let props = def.properties ?? {};
-  let required = new Set(def.required ?? []);
-  if (Object.keys(props).length === 0 && def.record) {
-    props = def.record.properties ?? {};
-    required = new Set(def.record.required ?? []);
+): { properties: Record<string, LexiconProperty>; required: ReadonlySet<string> } {
+  const body = def.type === "record" && def.record ? def.record : def;
+  return {
+    properties: body.properties ?? {},
+    required: body.required?.length ? new Set(body.required) : NO_REQUIRED,
+  };
+}
+
+/** A def field with its required flag, owning def, and display labels resolved */
+export type FlatField = LexiconProperty & {
+  required: boolean;
+  def: string;
+  typeLabel: string;
+  /** knownValues joined for display; empty when the field has none */
+  knownValuesLabel: string;
+};
+
+/** Get a def's fields with per-field display metadata computed up front */
+export function getDefFields(
+  defName: string,
+  def: LexiconDef
+): Record<string, FlatField> {
+  const { properties, required } = getDefProperties(def);
+  const result: Record<string, FlatField> = {};
+  for (const [fieldName, fieldMeta] of Object.entries(properties)) {
+    result[fieldName] = {
+      ...fieldMeta,
+      required: required.has(fieldName),
+      def: defName,
+      typeLabel: typeLabel(fieldMeta),
+      knownValuesLabel: fieldMeta.knownValues?.join(", ") ?? "",
+    };
   }
-  return { properties: props, required };
+  return result;
 }
 
-/** Get all properties flattened across all defs */
-export function getFlatProperties(
+/** Get every def's fields, keyed by def name */
+export function getLexiconFields(
   lexicon: Lexicon
-): Record<string, LexiconProperty & { required: boolean; def: string }> {
-  const result: Record<
-    string,
-    LexiconProperty & { required: boolean; def: string }
-  > = {};
+): Record<string, Record<string, FlatField>> {
+  const result: Record<string, Record<string, FlatField>> = {};
   for (const [defName, defBody] of Object.entries(lexicon.defs)) {
-    const { properties, required } = getDefProperties(defBody);
-    for (const [fieldName, fieldMeta] of Object.entries(properties)) {
-      result[fieldName] = {
-        ...fieldMeta,
-        required: required.has(fieldName),
-        def: defName,
-      };
+    result[defName] = getDefFields(defName, defBody);
+  }
+  return result;
+}
+
+/** Get all properties flattened across all defs */
+export function getFlatProperties(
+  defFields: Record<string, Record<string, FlatField>>
+): Record<string, FlatField> {
+  const result: Record<string, FlatField> = {};
+  for (const fields of Object.values(defFields)) {
+    for (const [fieldName, field] of Object.entries(fields)) {
+      result[fieldName] = field;
     }
   }
   return result;
 }
 
+/** Map each lexicon field to its DwC term (AT Protocol fields excluded) */
+export function getFieldDwcTerms(
+  fields: Record<string, LexiconProperty>,
+  dwcTerms: Record<string, DwcTerm>
+): Map<string, DwcTerm> {
+  const result = new Map<string, DwcTerm>();
+  for (const fieldName of Object.keys(fields)) {
+    if (ATPROTO_FIELDS.has(fieldName)) continue;
+    const term = dwcTerms[FIELD_TO_DWC[fieldName] ?? fieldName];
+    if (term) result.set(fieldName, term);
+  }
+  return result;
+}
+
 /** Get a human-readable type label for a property */
 export function typeLabel(prop: LexiconProperty): string {
   const t = prop.type ?? "";
@@ -2,22 +2,33 @@ import { useParams, Navigate } from "react-router-dom";
 import { Box } from "@mui/material";
 import FieldTable from "../components/FieldTable";
 import DwcAlignmentTable from "../components/DwcAlignmentTable";
-import { MODELS, getFlatProperties, getDefProperties } from "../data/lexicons";
-import { dwcTerms } from "../data/dwcTerms";
+import {
+  MODELS,
+  getFlatProperties,
+  getLexiconFields,
+  getFieldDwcTerms,
+} from "../data/lexicons";
+import { dwcTerms, dwcTermsByTable } from "../data/dwcTerms";
 import { palette, fonts } from "../theme";
 
+/** Per-model field data, derived once from the static lexicons */
+const MODEL_FIELDS = new Map(
+  MODELS.map((m) => {
+    const defFields = getLexiconFields(m.lexicon);
+    const fieldTerms = getFieldDwcTerms(getFlatProperties(defFields), dwcTerms);
+    const mappedTerms: ReadonlySet<string> = new Set(
+      Array.from(fieldTerms.values(), (t) => t.name)
+    );
+    return [m.slug, { defFields, fieldTerms, mappedTerms }];
+  })
+);
+
 export default function LexiconPage() {
   const { slug } = useParams<{ slug: string }>();
   const model = MODELS.find((m) => m.slug === slug);
   if (!model) return <Navigate to="/" replace />;
 
-  const lexProps = getFlatProperties(model.lexicon);
-
-  const mainDef = model.lexicon.defs["main"];
-  const { properties: mainProps, required: mainRequired } = getDefProperties(mainDef);
-  const mainFields = Object.fromEntries(
-    Object.entries(mainProps).map(([k, v]) => [k, { ...v, required: mainRequired.has(k), def: "main" }])
-  );
+  const { defFields, fieldTerms, mappedTerms } = MODEL_FIELDS.get(model.slug)!;
 
   const otherDefs = Object.entries(model.lexicon.defs).filter(([name]) => name !== "main");
   const lexId = model.lexicon.id;
@@ -70,36 +81,30 @@ export default function LexiconPage() {
         {model.description}
       </Box>
 
-      <FieldTable fields={mainFields} dwcTerms={dwcTerms} />
+      <FieldTable fields={defFields["main"]} fieldTerms={fieldTerms} />
 
-      {otherDefs.map(([defName, defBody]) => {
-        const { properties, required } = getDefProperties(defBody);
-        const fields = Object.fromEntries(
-          Object.entries(properties).map(([k, v]) => [k, { ...v, required: required.has(k), def: defName }])
-        );
-        return (
-          <Box key={defName} sx={{ mb: "36px" }}>
-            <Box
-              component="h4"
-              sx={{
-                fontFamily: fonts.mono,
-                fontSize: "13px",
-                fontWeight: 500,
-                color: palette.inkSoft,
-                m: "0 0 4px",
-              }}
-            >
-              #{defName}
-            </Box>
-            {defBody.description && (
-              <Box sx={{ fontSize: "13px", color: palette.inkSoft, mb: "12px" }}>
-                {defBody.description}
-              </Box>
-            )}
-            <FieldTable fields={fields} dwcTerms={dwcTerms} />
+      {otherDefs.map(([defName, defBody]) => (
+        <Box key={defName} sx={{ mb: "36px" }}>
+          <Box
+            component="h4"
+            sx={{
+              fontFamily: fonts.mono,
+              fontSize: "13px",
+              fontWeight: 500,
+              color: palette.inkSoft,
+              m: "0 0 4px",
+            }}
+          >
+            #{defName}
           </Box>
-        );
-      })}
+          {defBody.description && (
+            <Box sx={{ fontSize: "13px", color: palette.inkSoft, mb: "12px" }}>
+              {defBody.description}
+            </Box>
+          )}
+          <FieldTable fields={defFields[defName]} fieldTerms={fieldTerms} />
+        </Box>
+      ))}
 
       <Box
         component="pre"
@@ -133,8 +138,8 @@ export default function LexiconPage() {
 
       <DwcAlignmentTable
         classes={model.classes}
-        dwcTerms={dwcTerms}
-        lexProps={lexProps}
+        dwcTermsByTable={dwcTermsByTable}
+        mappedTerms={mappedTerms}
       />
     </>
   );